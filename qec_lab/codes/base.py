@@ -3,15 +3,44 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Callable
+
+import numpy as np
 from qiskit import QuantumCircuit
 
 
+def counts_to_arrays(counts: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a Qiskit counts dictionary into outcome and shot arrays.
+
+    Bit ``i`` of each outcome integer holds classical bit ``i``, matching the
+    little-endian ordering of Qiskit bitstrings. Register separators are ignored.
+    """
+
+    outcomes = np.fromiter(
+        (int(bitstring.replace(" ", ""), 2) for bitstring in counts),
+        dtype=np.int64,
+        count=len(counts),
+    )
+    shots = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return outcomes, shots
+
+
 class BaseCode(ABC):
     """Define the minimal interface required from any QEC code."""
 
     name: str
     n_physical: int
     n_logical: int = 1
+    # Decoded logical bit for every data-qubit outcome, indexed by its integer.
+    _lut: np.ndarray
+    # Number of recent logical tallies kept by ``_logical_tally``.
+    _TALLY_CACHE_SIZE = 16
+
+    def __init__(self) -> None:
+        # Built circuits keyed by logical state; see ``_cached_circuit``.
+        self._circuit_templates: dict[str, QuantumCircuit] = {}
+        # Recent logical tallies keyed by counts; see ``_logical_tally``.
+        self._tally_cache: dict[frozenset[tuple[str, int]], np.ndarray] = {}
 
     @abstractmethod
     def build_circuit(self, logical_state: str = "0") -> QuantumCircuit:
@@ -37,3 +66,58 @@ class BaseCode(ABC):
         compare them with the expected logical state, and compute the fraction
         of shots that correspond to logical errors.
         """
+
+    def _cached_circuit(
+        self, logical_state: str, build: Callable[[str], QuantumCircuit]
+    ) -> QuantumCircuit:
+        """Return a copy of the circuit for ``logical_state``, building it once.
+
+        Copying the cached template is much cheaper than re-issuing every gate
+        through the ``QuantumCircuit`` API on each call.
+        """
+
+        if logical_state not in self._circuit_templates:
+            self._circuit_templates[logical_state] = build(logical_state)
+        return self._circuit_templates[logical_state].copy()
+
+    def _logical_tally(self, counts: dict[str, int]) -> np.ndarray:
+        """Return the shots decoded as logical 0 and as logical 1.
+
+        Outcome bits beyond the width of ``_lut`` are ignored, so the lookup
+        table only needs to cover the data qubits. The last few tallies are
+        kept per instance and shared, so they are returned read-only.
+        """
+
+        key = frozenset(counts.items())
+        tally = self._tally_cache.get(key)
+        if tally is not None:
+            return tally
+
+        outcomes, shots = counts_to_arrays(counts)
+        logical_out = self._lut[outcomes & (len(self._lut) - 1)]
+        tally = np.bincount(logical_out, weights=shots, minlength=2)
+        tally.flags.writeable = False
+
+        if len(self._tally_cache) >= self._TALLY_CACHE_SIZE:
+            del self._tally_cache[next(iter(self._tally_cache))]
+        self._tally_cache[key] = tally
+        return tally
+
+    def _lut_error_rate(self, counts: dict[str, int], logical_state: str) -> float:
+        """Estimate the logical error rate by looking up each outcome in ``_lut``.
+
+        Decoded counts are cached, so scoring the same counts against both
+        logical states only decodes them once.
+        """
+
+        if logical_state not in {"0", "1"}:
+            raise ValueError("Only logical states '0' and '1' are supported.")
+
+        expected_logical = int(logical_state)
+        tally = self._logical_tally(counts)
+        total_shots = tally.sum()
+
+        if total_shots == 0:
+            return 0.0
+
+        return float(tally[1 - expected_logical] / total_shots)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .base import BaseCode
@@ -11,13 +12,20 @@ class RepetitionCode3(BaseCode):
     """Encode one logical qubit into three physical qubits via repetition."""
 
     def __init__(self) -> None:
+        super().__init__()
         self.name = "3-qubit repetition code"
         self.n_physical = 3
         self.n_logical = 1
+        self._lut = self._decode_outcomes(np.arange(1 << self.n_physical))
 
     def build_circuit(self, logical_state: str = "0") -> QuantumCircuit:
         """Construct the encoding circuit and measurements for the code."""
 
+        return self._cached_circuit(logical_state, self._encode)
+
+    def _encode(self, logical_state: str) -> QuantumCircuit:
+        """Build the circuit from scratch; ``build_circuit`` hands out copies."""
+
         circuit = QuantumCircuit(self.n_physical, self.n_physical)
 
         if logical_state == "1":
@@ -34,6 +42,13 @@ class RepetitionCode3(BaseCode):
 
         return circuit
 
+    @staticmethod
+    def _decode_outcomes(outcomes: np.ndarray) -> np.ndarray:
+        """Majority-vote an array of outcome integers down to logical bits."""
+
+        ones = np.bitwise_count(outcomes & 0b111)
+        return (ones >= 2).astype(np.uint8)
+
     def logical_error_rate_from_counts(
         self, counts: dict[str, int], logical_state: str = "0"
     ) -> float:
@@ -43,20 +58,4 @@ class RepetitionCode3(BaseCode):
         more care is needed when mixing registers or changing measurement order.
         """
 
-        if logical_state not in {"0", "1"}:
-            raise ValueError("Only logical states '0' and '1' are supported.")
-
-        expected_logical = int(logical_state)
-        total_shots = sum(counts.values())
-        logical_errors = 0
-
-        for bitstring, shots in counts.items():
-            ones = bitstring.count("1")
-            logical_out = 1 if ones >= 2 else 0
-            if logical_out != expected_logical:
-                logical_errors += shots
-
-        if total_shots == 0:
-            return 0.0
-
-        return logical_errors / total_shots
+        return self._lut_error_rate(counts, logical_state)
@@ -2,28 +2,42 @@
 
 from __future__ import annotations
 
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .base import BaseCode
 
+# Data qubit q = 3 * row + col sits at bit q of the outcome integer.
+_ROW_MASKS = (0b000000111, 0b000111000, 0b111000000)
+_COL_MASKS = (0b001001001, 0b010010010, 0b100100100)
+
 
 class RotatedSurfaceCodeD3(BaseCode):
     """Demonstrate a distance-3 rotated surface code using passive decoding."""
 
     def __init__(self) -> None:
+        super().__init__()
         self.name = "d=3 rotated surface code"
         self.n_physical = 17  # 9 data qubits + 8 ancilla qubits
+        self.n_data = 9
         self.n_logical = 1
+        self._lut = self._decode_outcomes(np.arange(1 << self.n_data))
 
     def build_circuit(self, logical_state: str = "0") -> QuantumCircuit:
         """Construct a small rotated-surface-style circuit with parity checks."""
 
+        return self._cached_circuit(logical_state, self._encode)
+
+    def _encode(self, logical_state: str) -> QuantumCircuit:
+        """Build the circuit from scratch; ``build_circuit`` hands out copies."""
+
         if logical_state not in {"0", "1"}:
             raise ValueError("Only logical states '0' and '1' are supported.")
 
-        circuit = QuantumCircuit(self.n_physical, self.n_physical)
+        # Only the data qubits are read out; the decoder never looks at ancillas.
+        circuit = QuantumCircuit(self.n_physical, self.n_data)
 
-        data = list(range(9))
+        data = list(range(self.n_data))
         anc_x = list(range(9, 13))
         anc_z = list(range(13, 17))
 
@@ -55,39 +69,23 @@ class RotatedSurfaceCodeD3(BaseCode):
             for q in qubits:
                 circuit.cx(q, anc)
 
-        for qubit in range(self.n_physical):
-            circuit.measure(qubit, qubit)
+        for bit, qubit in enumerate(data):
+            circuit.measure(qubit, bit)
 
         return circuit
 
+    @staticmethod
+    def _decode_outcomes(outcomes: np.ndarray) -> np.ndarray:
+        """Combine row and column majorities for an array of outcome integers."""
+
+        votes = np.zeros(len(outcomes), dtype=np.int64)
+        for mask in _ROW_MASKS + _COL_MASKS:
+            votes += np.bitwise_count(outcomes & mask) >= 2
+        return (votes >= 3).astype(np.uint8)
+
     def logical_error_rate_from_counts(
         self, counts: dict[str, int], logical_state: str = "0"
     ) -> float:
         """Decode by combining row/column majorities to mimic surface-code logic."""
 
-        if logical_state not in {"0", "1"}:
-            raise ValueError("Only logical states '0' and '1' are supported.")
-
-        expected_logical = int(logical_state)
-        total_shots = sum(counts.values())
-        logical_errors = 0
-
-        for bitstring, shots in counts.items():
-            bits = bitstring[::-1]
-            data_bits = bits[:9]
-            rows = [
-                1 if data_bits[start : start + 3].count("1") >= 2 else 0
-                for start in (0, 3, 6)
-            ]
-            cols = [
-                1 if data_bits[start::3][:3].count("1") >= 2 else 0 for start in range(3)
-            ]
-            votes = rows + cols
-            logical_out = 1 if votes.count(1) >= 3 else 0
-            if logical_out != expected_logical:
-                logical_errors += shots
-
-        if total_shots == 0:
-            return 0.0
-
-        return logical_errors / total_shots
+        return self._lut_error_rate(counts, logical_state)
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .base import BaseCode
 
+# Bit masks selecting each three-qubit block of the outcome integer.
+_BLOCK_MASKS = (0b000000111, 0b000111000, 0b111000000)
+
 
 class ShorCode9(BaseCode):
     """Encode one logical qubit into the 9-qubit Shor code."""
 
     def __init__(self) -> None:
+        super().__init__()
         self.name = "9-qubit Shor code"
         self.n_physical = 9
         self.n_logical = 1
+        self._lut = self._decode_outcomes(np.arange(1 << self.n_physical))
 
     def build_circuit(self, logical_state: str = "0") -> QuantumCircuit:
         """Build the encode/decode circuit for the Shor code."""
 
+        return self._cached_circuit(logical_state, self._encode)
+
+    def _encode(self, logical_state: str) -> QuantumCircuit:
+        """Build the circuit from scratch; ``build_circuit`` hands out copies."""
+
         circuit = QuantumCircuit(self.n_physical, self.n_physical)
 
         if logical_state == "1":
@@ -43,30 +54,18 @@ class ShorCode9(BaseCode):
 
         return circuit
 
+    @staticmethod
+    def _decode_outcomes(outcomes: np.ndarray) -> np.ndarray:
+        """Majority-vote each triple, then the triples, for an array of outcomes."""
+
+        block_votes = np.zeros(len(outcomes), dtype=np.int64)
+        for mask in _BLOCK_MASKS:
+            block_votes += np.bitwise_count(outcomes & mask) >= 2
+        return (block_votes >= 2).astype(np.uint8)
+
     def logical_error_rate_from_counts(
         self, counts: dict[str, int], logical_state: str = "0"
     ) -> float:
         """Decode by majority vote within each triple and across triples."""
 
-        if logical_state not in {"0", "1"}:
-            raise ValueError("Only logical states '0' and '1' are supported.")
-
-        expected_logical = int(logical_state)
-        total_shots = sum(counts.values())
-        logical_errors = 0
-
-        for bitstring, shots in counts.items():
-            bits = bitstring[::-1]
-            block_values = []
-            for start in (0, 3, 6):
-                block = bits[start : start + 3]
-                ones = block.count("1")
-                block_values.append(1 if ones >= 2 else 0)
-            logical_out = 1 if block_values.count(1) >= 2 else 0
-            if logical_out != expected_logical:
-                logical_errors += shots
-
-        if total_shots == 0:
-            return 0.0
-
-        return logical_errors / total_shots
+        return self._lut_error_rate(counts, logical_state)
@@ -2,38 +2,70 @@
 
 from __future__ import annotations
 
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .base import BaseCode
 
+# 8 even-weight Hamming [7,4,3] codewords used in |0_L>
+_EVEN_CODEWORDS: tuple[str, ...] = (
+    "0000000",
+    "1010101",
+    "0110011",
+    "1100110",
+    "0001111",
+    "1011010",
+    "0111100",
+    "1101001",
+)
+
+_ODD_CODEWORDS: tuple[str, ...] = tuple(
+    "".join("1" if b == "0" else "0" for b in cw) for cw in _EVEN_CODEWORDS
+)
+
+# Codewords packed into single integers with qubit i at bit i.
+_EVEN_CW_INTS: tuple[int, ...] = tuple(int(cw[::-1], 2) for cw in _EVEN_CODEWORDS)
+_ODD_CW_INTS: tuple[int, ...] = tuple(int(cw[::-1], 2) for cw in _ODD_CODEWORDS)
+
+# (codeword, logical bit) pairs, even (logical 0) codewords first.
+_TAGGED_CW_INTS: tuple[tuple[int, int], ...] = tuple(
+    (cw, 0) for cw in _EVEN_CW_INTS
+) + tuple((cw, 1) for cw in _ODD_CW_INTS)
+
+
+def _nearest_logical(data: int) -> int:
+    """Return the logical bit of the codeword nearest to a packed 7-bit word."""
+    # The code is perfect: every 7-bit word is within distance 1 of exactly one
+    # codeword, so the first match within 1 is the nearest.
+    for cw, logical in _TAGGED_CW_INTS:
+        if (data ^ cw).bit_count() <= 1:
+            return logical
+
+    raise AssertionError(f"No codeword within distance 1 of {data:07b}.")
+
+
+# Decoded logical bit for all 128 data words.
+_LUT: bytes = bytes(_nearest_logical(data) for data in range(1 << 7))
+
 
 class SteaneCode7(BaseCode):
     """Encode one logical qubit into the 7-qubit Steane [[7,1,3]] code."""
 
-    # 8 even-weight Hamming [7,4,3] codewords used in |0_L>
-    _EVEN_CODEWORDS: tuple[str, ...] = (
-        "0000000",
-        "1010101",
-        "0110011",
-        "1100110",
-        "0001111",
-        "1011010",
-        "0111100",
-        "1101001",
-    )
-
-    _ODD_CODEWORDS: tuple[str, ...] = tuple(
-        "".join("1" if b == "0" else "0" for b in cw) for cw in _EVEN_CODEWORDS
-    )
-
     def __init__(self) -> None:
+        super().__init__()
         self.name = "7-qubit Steane code"
         self.n_physical = 7
         self.n_logical = 1
+        self._lut = np.frombuffer(_LUT, dtype=np.uint8)
 
     def build_circuit(self, logical_state: str = "0") -> QuantumCircuit:
         """Construct an encoding circuit and Z-basis measurements for Steane [[7,1,3]]."""
 
+        return self._cached_circuit(logical_state, self._encode)
+
+    def _encode(self, logical_state: str) -> QuantumCircuit:
+        """Build the circuit from scratch; ``build_circuit`` hands out copies."""
+
         if logical_state not in {"0", "1"}:
             raise ValueError("Only logical states '0' and '1' are supported.")
 
@@ -66,58 +98,36 @@ class SteaneCode7(BaseCode):
         return circuit
 
     @staticmethod
-    def _hamming_distance(a: str, b: str) -> int:
-        """Compute Hamming distance between two equal-length bitstrings."""
-        if len(a) != len(b):
-            raise ValueError("Bitstrings must have the same length.")
-        return sum(ch1 != ch2 for ch1, ch2 in zip(a, b))
+    def _hamming_distance(a: int | str, b: int | str) -> int:
+        """Compute Hamming distance between two packed codewords.
+
+        Two equal-length bitstrings are still accepted for backwards
+        compatibility; mixing a bitstring with an integer is rejected.
+        """
+        if isinstance(a, str) != isinstance(b, str):
+            raise TypeError("Pass two bitstrings or two packed integers, not a mix.")
+        if isinstance(a, str):
+            if len(a) != len(b):
+                raise ValueError("Bitstrings must have the same length.")
+            a, b = int(a, 2), int(b, 2)
+        return (a ^ b).bit_count()
 
     def _decode_logical_bit(self, bitstring: str) -> int:
         """Given a full measurement outcome bitstring, decode logical 0/1."""
-        bits_str = bitstring[::-1]
+        bits_str = bitstring.replace(" ", "")
 
         if len(bits_str) < self.n_physical:
             raise ValueError(
                 f"Expected at least {self.n_physical} bits in measurement bitstring, "
                 f"got '{bitstring}'."
             )
-        data_bits = bits_str[: self.n_physical]
-        best_logical = 0
-        best_dist = self.n_physical + 1
-
-        for cw in self._EVEN_CODEWORDS:
-            d = self._hamming_distance(data_bits, cw)
-            if d < best_dist:
-                best_dist = d
-                best_logical = 0
-
-        for cw in self._ODD_CODEWORDS:
-            d = self._hamming_distance(data_bits, cw)
-            if d < best_dist:
-                best_dist = d
-                best_logical = 1
-
-        return best_logical
+        data_int = int(bits_str, 2) & ((1 << self.n_physical) - 1)
 
+        return _LUT[data_int]
 
     def logical_error_rate_from_counts(
         self, counts: dict[str, int], logical_state: str = "0"
     ) -> float:
         """Decode via Hamming-style lookup and estimate the logical error rate."""
 
-        if logical_state not in {"0", "1"}:
-            raise ValueError("Only logical states '0' and '1' are supported.")
-
-        expected_logical = int(logical_state)
-        total_shots = sum(counts.values())
-        logical_errors = 0
-
-        for bitstring, shots in counts.items():
-            logical_out = self._decode_logical_bit(bitstring)
-            if logical_out != expected_logical:
-                logical_errors += shots
-
-        if total_shots == 0:
-            return 0.0
-
-        return logical_errors / total_shots
+        return self._lut_error_rate(counts, logical_state)
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 from typing import Dict
 
-from qiskit import ClassicalRegister, QuantumCircuit, transpile
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit
 from qiskit_aer import AerSimulator
 
 
-_SYNDROME_TO_DATA = {
-    0b01: 0,  # only ancilla-0 fired -> flip qubit 0
-    0b10: 2,  # only ancilla-1 fired -> flip qubit 2
-    0b11: 1,  # both fired -> middle qubit
-}
+# Data qubit to flip, indexed by the syndrome register value.
+_SYNDROME_TO_DATA: tuple[int | None, ...] = (
+    None,  # no ancilla fired -> nothing to correct
+    0,  # only ancilla-0 fired -> flip qubit 0
+    2,  # only ancilla-1 fired -> flip qubit 2
+    1,  # both fired -> middle qubit
+)
 
 
 def build_repetition3_active_correction_circuit(
@@ -49,9 +52,13 @@ def build_repetition3_active_correction_circuit(
     circuit.measure(4, syndrome_reg[1])
     circuit.barrier()
 
-    for syndrome_value, target_qubit in _SYNDROME_TO_DATA.items():
-        with circuit.if_test((syndrome_reg, syndrome_value)):
-            circuit.x(target_qubit)
+    # A single switch on the syndrome replaces one if_test region per correction.
+    with circuit.switch(syndrome_reg) as case:
+        for syndrome_value, target_qubit in enumerate(_SYNDROME_TO_DATA):
+            if target_qubit is None:
+                continue
+            with case(syndrome_value):
+                circuit.x(target_qubit)
 
     circuit.barrier()
 
@@ -63,29 +70,38 @@ def build_repetition3_active_correction_circuit(
 
 
 def run_active_correction_demo(
-    logical_state: str = "0", error_qubit: int | None = 1, shots: int = 1024
+    logical_state: str = "0",
+    error_qubit: int | None = 1,
+    shots: int = 1024,
+    verbose: bool = True,
 ) -> Dict[str, int]:
     """Execute the active-correction circuit and aggregate counts over the data register."""
 
     circuit = build_repetition3_active_correction_circuit(
         logical_state=logical_state, error_qubit=error_qubit
     )
+    # Every operation in the circuit is native to Aer, so it runs untranspiled.
     simulator = AerSimulator()
-    compiled = transpile(circuit, simulator)
-    result = simulator.run(compiled, shots=shots).result()
+    result = simulator.run(circuit, shots=shots).result()
     raw_counts = result.get_counts()
 
-    data_counts: Dict[str, int] = {}
+    # The data register is the rightmost field of each bitstring; tally it by value.
+    data_tally = np.zeros(8, dtype=np.int64)
     for bitstring, count in raw_counts.items():
-        data_bits = bitstring[-3:]
-        data_counts[data_bits] = data_counts.get(data_bits, 0) + count
+        data_tally[int(bitstring[-3:], 2)] += count
 
     ideal = "000" if logical_state == "0" else "111"
-    success = data_counts.get(ideal, 0) / shots
-    print(
-        f"[Active demo] logical={logical_state}, error_qubit={error_qubit}, "
-        f"success={success:.3f}"
-    )
-    print("Data-register counts:", data_counts)
+    success = data_tally[int(ideal, 2)] / shots
+    data_counts: Dict[str, int] = {
+        format(value, "03b"): int(count)
+        for value, count in enumerate(data_tally)
+        if count
+    }
+    if verbose:
+        print(
+            f"[Active demo] logical={logical_state}, error_qubit={error_qubit}, "
+            f"success={success:.3f}"
+        )
+        print("Data-register counts:", data_counts)
 
     return data_counts
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
 
+import numpy as np
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
+from qiskit_aer.jobs import AerJob
+from qiskit_aer.noise import NoiseModel
 
 from qec_lab.codes import BaseCode, RepetitionCode3
 from qec_lab.noise import (
@@ -20,6 +26,37 @@ _NOISE_BUILDERS = {
     "amplitude_damping": amplitude_damping_noise_model,
 }
 
+# Noise models are attached per run, so a single simulator serves every call.
+_SIM = AerSimulator()
+_NON_GATE_OPS = frozenset({"measure", "barrier"})
+
+
+def _runnable(circuit: QuantumCircuit, noise_model: NoiseModel) -> QuantumCircuit:
+    """Return ``circuit`` as is when every gate in it is in the noise model's basis.
+
+    The noise model replaces Aer's default basis, and gates outside it would run
+    noiselessly. The built-in codes already fit, so the transpiler is skipped for
+    them; other circuits get a minimal, unoptimized transpile into that basis.
+    """
+
+    basis = noise_model.basis_gates
+    if set(circuit.count_ops()) <= _NON_GATE_OPS.union(basis):
+        return circuit
+    return transpile(circuit, basis_gates=basis, optimization_level=0)
+
+
+@functools.lru_cache(maxsize=None)
+def _physical_circuit(logical_state: str) -> QuantumCircuit:
+    """Return the single-qubit prepare-and-measure circuit."""
+
+    circuit = QuantumCircuit(1, 1)
+    if logical_state == "1":
+        circuit.x(0)
+
+    circuit.measure(0, 0)
+
+    return circuit
+
 
 def run_physical_qubit(
     p: float, logical_state: str = "0", shots: int = 4096, noise_type: str = "bit_flip"
@@ -31,16 +68,10 @@ def run_physical_qubit(
     if noise_type not in _NOISE_BUILDERS:
         raise ValueError(f"Unknown noise_type '{noise_type}'.")
 
-    circuit = QuantumCircuit(1, 1)
-    if logical_state == "1":
-        circuit.x(0)
-
-    circuit.measure(0, 0)
-
     noise_model = _NOISE_BUILDERS[noise_type](p)
-    simulator = AerSimulator(noise_model=noise_model)
-    compiled = transpile(circuit, simulator)
-    counts = simulator.run(compiled, shots=shots).result().get_counts()
+    circuit = _runnable(_physical_circuit(logical_state), noise_model)
+    job = _SIM.run(circuit, shots=shots, noise_model=noise_model)
+    counts = job.result().get_counts()
 
     expected = logical_state
     total_shots = sum(counts.values())
@@ -52,36 +83,102 @@ def run_physical_qubit(
     return wrong_shots / total_shots
 
 
+def _submit_point(
+    circuit: QuantumCircuit, p: float, noise_type: str, shots: int, **run_options
+) -> AerJob:
+    """Start an Aer job for one noise strength without waiting for its result."""
+
+    noise_model = _NOISE_BUILDERS[noise_type](p)
+    return _SIM.run(circuit, shots=shots, noise_model=noise_model, **run_options)
+
+
+def _one_point(
+    code: BaseCode,
+    circuit: QuantumCircuit,
+    p: float,
+    noise_type: str,
+    logical_state: str,
+    shots: int,
+) -> float:
+    """Simulate a single noise strength and return its logical error rate."""
+
+    # Parallelism comes from the process pool; keep Aer single-threaded per worker.
+    job = _submit_point(circuit, p, noise_type, shots, max_parallel_threads=1)
+    counts = job.result().get_counts()
+    return code.logical_error_rate_from_counts(counts, logical_state=logical_state)
+
+
+def _print_point(code: BaseCode, noise_type: str, p: float, logical_error: float) -> None:
+    """Print the progress line for one finished sweep point."""
+
+    print(
+        f"[{code.name} | noise={noise_type}] p={p:.4f}, "
+        f"logical error={logical_error:.4f}"
+    )
+
+
 def run_code_on_noise_grid(
     code: BaseCode,
     ps: List[float],
     noise_type: str = "bit_flip",
     logical_state: str = "0",
     shots: int = 4096,
+    max_workers: int = 1,
+    verbose: bool = True,
 ) -> Dict[float, float]:
-    """Run Monte Carlo sweeps to map physical p values to logical error rates."""
+    """Run Monte Carlo sweeps to map physical p values to logical error rates.
+
+    By default the points run in-process: every Aer job is queued up front and
+    the results are decoded as they finish. Setting ``max_workers`` above 1
+    simulates each ``p`` in a spawned worker process instead. Spawned workers
+    re-import the calling script, so it must guard its entry point with
+    ``if __name__ == "__main__":``, and ``code`` must be picklable (its class
+    cannot live in ``__main__`` or a notebook). Each progress line is printed
+    as soon as its point and all earlier ones have finished; pass
+    ``verbose=False`` to skip them.
+    """
 
     if noise_type not in _NOISE_BUILDERS:
         raise ValueError(f"Unknown noise_type '{noise_type}'.")
 
-    results: Dict[float, float] = {}
-    noise_builder = _NOISE_BUILDERS[noise_type]
-
-    for p in ps:
-        noise_model = noise_builder(p)
-        circuit = code.build_circuit(logical_state=logical_state)
-        simulator = AerSimulator(noise_model=noise_model)
-        compiled = transpile(circuit, simulator)
-        counts = simulator.run(compiled, shots=shots).result().get_counts()
-        logical_error = code.logical_error_rate_from_counts(
-            counts, logical_state=logical_state
-        )
-        results[p] = logical_error
-        print(
-            f"[{code.name} | noise={noise_type}] p={p:.4f}, logical error={logical_error:.4f}"
-        )
-
-    return results
+    # Accept arrays and generators as well as lists; the sweep walks ps twice.
+    ps = list(ps)
+    if len(ps) == 0:
+        return {}
+
+    # The circuit does not depend on p, so build it once for the whole sweep.
+    # The basis only depends on the noise type once p > 0; zero-strength
+    # channels are dropped, so take the basis from the strongest point.
+    reference = _NOISE_BUILDERS[noise_type](max(ps))
+    circuit = _runnable(code.build_circuit(logical_state=logical_state), reference)
+
+    logical_errors = np.empty(len(ps))
+    if max_workers <= 1:
+        jobs = [_submit_point(circuit, p, noise_type, shots) for p in ps]
+        for i, (p, job) in enumerate(zip(ps, jobs)):
+            logical_errors[i] = code.logical_error_rate_from_counts(
+                job.result().get_counts(), logical_state=logical_state
+            )
+            if verbose:
+                _print_point(code, noise_type, p, logical_errors[i])
+    else:
+        # Forking after Aer has started its OpenMP runtime can deadlock the workers.
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _one_point, code, circuit, p, noise_type, logical_state, shots
+                )
+                for p in ps
+            ]
+            for i, (p, future) in enumerate(zip(ps, futures)):
+                logical_errors[i] = future.result()
+                if verbose:
+                    _print_point(code, noise_type, p, logical_errors[i])
+
+    return dict(zip(ps, logical_errors.tolist()))
 
 
 if __name__ == "__main__":
@@ -2,21 +2,55 @@
 
 from __future__ import annotations
 
-from qiskit_aer.noise import NoiseModel, depolarizing_error, pauli_error, amplitude_damping_error
+from functools import lru_cache
+
+from qiskit_aer.noise import (
+    NoiseModel,
+    QuantumError,
+    depolarizing_error,
+    pauli_error,
+    amplitude_damping_error,
+)
 
 _SINGLE_QUBIT_GATES = ["id", "x", "y", "z", "h", "sx"]
 _TWO_QUBIT_GATES = ["cx"]
 
+# The channels below are memoized on their strength rounded to 12 decimals.
+# QuantumError objects are never mutated, so they are safe to share; every
+# public builder still wraps them in a fresh NoiseModel the caller may modify.
 
-def bit_flip_noise_model(p: float) -> NoiseModel:
-    """Return a NoiseModel where each gate is followed by an X flip with prob p."""
 
-    if not 0.0 <= p <= 1.0:
-        raise ValueError("Probability p must be between 0 and 1.")
+@lru_cache(maxsize=128)
+def _pauli_channels(pauli: str, p: float) -> tuple[QuantumError, QuantumError]:
+    """Return the single- and two-qubit channels applying ``pauli`` with prob p."""
+
+    single_qubit_error = pauli_error([(pauli, p), ("I", 1 - p)])
+    return single_qubit_error, single_qubit_error.tensor(single_qubit_error)
+
+
+@lru_cache(maxsize=128)
+def _depolarizing_channels(p: float) -> tuple[QuantumError, QuantumError]:
+    """Return the single- and two-qubit depolarizing channels of strength p."""
+
+    return depolarizing_error(p, 1), depolarizing_error(p, 2)
+
+
+@lru_cache(maxsize=128)
+def _amplitude_damping_channels(gamma: float) -> tuple[QuantumError, QuantumError]:
+    """Return the single- and two-qubit amplitude-damping channels."""
+
+    # Single-qubit amplitude-damping channel
+    single_qubit_error = amplitude_damping_error(gamma)
+    # For a 2-qubit gate, apply the same channel independently on both qubits
+    return single_qubit_error, single_qubit_error.tensor(single_qubit_error)
+
+
+def _gate_noise_model(
+    single_qubit_error: QuantumError, two_qubit_error: QuantumError
+) -> NoiseModel:
+    """Build a new NoiseModel attaching the given channels after every gate."""
 
     noise_model = NoiseModel()
-    single_qubit_error = pauli_error([("X", p), ("I", 1 - p)])
-    two_qubit_error = single_qubit_error.tensor(single_qubit_error)
 
     for gate in _SINGLE_QUBIT_GATES:
         noise_model.add_all_qubit_quantum_error(single_qubit_error, gate)
@@ -27,23 +61,22 @@ def bit_flip_noise_model(p: float) -> NoiseModel:
     return noise_model
 
 
-def phase_flip_noise_model(p: float) -> NoiseModel:
-    """Return a NoiseModel applying Z flips with probability p after each gate."""
+def bit_flip_noise_model(p: float) -> NoiseModel:
+    """Return a NoiseModel where each gate is followed by an X flip with prob p."""
 
     if not 0.0 <= p <= 1.0:
         raise ValueError("Probability p must be between 0 and 1.")
 
-    noise_model = NoiseModel()
-    single_qubit_error = pauli_error([("Z", p), ("I", 1 - p)])
-    two_qubit_error = single_qubit_error.tensor(single_qubit_error)
+    return _gate_noise_model(*_pauli_channels("X", round(p, 12)))
 
-    for gate in _SINGLE_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(single_qubit_error, gate)
 
-    for gate in _TWO_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(two_qubit_error, gate)
+def phase_flip_noise_model(p: float) -> NoiseModel:
+    """Return a NoiseModel applying Z flips with probability p after each gate."""
 
-    return noise_model
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("Probability p must be between 0 and 1.")
+
+    return _gate_noise_model(*_pauli_channels("Z", round(p, 12)))
 
 
 def depolarizing_noise_model(p: float) -> NoiseModel:
@@ -52,17 +85,7 @@ def depolarizing_noise_model(p: float) -> NoiseModel:
     if not 0.0 <= p <= 1.0:
         raise ValueError("Probability p must be between 0 and 1.")
 
-    noise_model = NoiseModel()
-    single_qubit_error = depolarizing_error(p, 1)
-    two_qubit_error = depolarizing_error(p, 2)
-
-    for gate in _SINGLE_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(single_qubit_error, gate)
-
-    for gate in _TWO_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(two_qubit_error, gate)
-
-    return noise_model
+    return _gate_noise_model(*_depolarizing_channels(round(p, 12)))
 
 def amplitude_damping_noise_model(gamma: float) -> NoiseModel:
     """Return a NoiseModel with amplitude-damping (T1-like) noise after each gate."""
@@ -70,16 +93,4 @@ def amplitude_damping_noise_model(gamma: float) -> NoiseModel:
     if not 0.0 <= gamma <= 1.0:
         raise ValueError("Damping parameter gamma must be between 0 and 1.")
 
-    noise_model = NoiseModel()
-    # Single-qubit amplitude-damping channel
-    single_qubit_error = amplitude_damping_error(gamma)
-    # For a 2-qubit gate, apply the same channel independently on both qubits
-    two_qubit_error = single_qubit_error.tensor(single_qubit_error)
-
-    for gate in _SINGLE_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(single_qubit_error, gate)
-
-    for gate in _TWO_QUBIT_GATES:
-        noise_model.add_all_qubit_quantum_error(two_qubit_error, gate)
-
-    return noise_model
\ No newline at end of file
+    return _gate_noise_model(*_amplitude_damping_channels(round(gamma, 12)))
\ No newline at end of file